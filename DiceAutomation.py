@@ -9,11 +9,15 @@ from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 import nltk
 import time
+import json
+import random
+import hashlib
 import logging
 import openai
 from PyPDF2 import PdfReader
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from urllib.parse import urlparse
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger()
@@ -21,11 +25,163 @@ logger = logging.getLogger()
 # Load SBERT model
 model = SentenceTransformer('all-MiniLM-L6-v2')
 
+# Point at a local stand-in server (see dice_standin_server.py) to exercise throttling logic
+DICE_BASE_URL = os.getenv("DICE_BASE_URL", "https://www.dice.com").rstrip("/")
+
+# Lean Browser Profile
+# Resource types Dice pages don't need for scraping or applying
+BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Third-party hosts (ads, analytics, session replay) that keep "networkidle" from settling
+BLOCKED_HOSTS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "facebook.net",
+    "facebook.com",
+    "linkedin.com",
+    "licdn.com",
+    "bing.com",
+    "hotjar.com",
+    "newrelic.com",
+    "nr-data.net",
+    "segment.io",
+    "segment.com",
+    "optimizely.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+    "adsrvr.org",
+    "taboola.com",
+    "criteo.com",
+    "demdex.net",
+]
+
+# Hosts that are never blocked, even if they match a rule above
+ALLOWED_HOSTS = [
+    "dice.com",
+]
+
+# Rough transfer sizes used to estimate bytes saved by an aborted request
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "script": 60_000,
+    "stylesheet": 20_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "other": 5_000,
+}
+
+LEAN_BROWSER_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+]
+
+def _host_matches(host, patterns):
+    """True if host equals a pattern or is a subdomain of it."""
+    return any(host == p or host.endswith("." + p) for p in patterns)
+
+class RequestBlocker:
+    """
+    Playwright route handler that aborts unneeded resource types and third-party hosts.
+    Attach once per context; call summary() at the end of a run for the savings report.
+    """
+
+    def __init__(self, blocked_resource_types=None, blocked_hosts=None, allowed_hosts=None):
+        self.blocked_resource_types = set(BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types)
+        self.blocked_hosts = list(BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts)
+        self.allowed_hosts = list(ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts)
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_saved = 0
+        self.blocked_by_type = {}
+
+    @staticmethod
+    def _is_main_frame_navigation(request):
+        try:
+            return request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:
+            # Service-worker requests have no frame
+            return False
+
+    def should_block(self, request):
+        # Never block the page itself; third-party iframes still go through the host lists
+        if self._is_main_frame_navigation(request):
+            return False
+        resource_type = request.resource_type
+        host = (urlparse(request.url).hostname or "").lower()
+        if resource_type in self.blocked_resource_types:
+            return True
+        if not host or _host_matches(host, self.allowed_hosts):
+            return False
+        return _host_matches(host, self.blocked_hosts)
+
+    def handle(self, route, request):
+        resource_type = request.resource_type
+        try:
+            if self.should_block(request):
+                self.requests_blocked += 1
+                self.bytes_saved += ESTIMATED_RESOURCE_BYTES.get(resource_type, ESTIMATED_RESOURCE_BYTES["other"])
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+                route.abort("blockedbyclient")
+            else:
+                self.requests_allowed += 1
+                route.continue_()
+        except Exception as e:
+            # Route may already be handled if the page was closed mid-request
+            logger.debug(f"Route handling skipped for {request.url}: {e}")
+
+    def attach(self, context):
+        context.route("**/*", self.handle)
+        return self
+
+    def summary(self):
+        return {
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "estimated_bytes_saved": self.bytes_saved,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+    def log_summary(self):
+        stats = self.summary()
+        logger.info(
+            f"Request blocking saved {stats['requests_blocked']} requests "
+            f"(~{stats['estimated_bytes_saved'] / 1_000_000:.1f} MB), "
+            f"allowed {stats['requests_allowed']}. By type: {stats['blocked_by_type']}"
+        )
+        return stats
+
+def launch_lean_browser(playwright, headless=None):
+    """Launch Chromium headless by default; set HEADLESS=false to watch the run."""
+    if headless is None:
+        headless = os.getenv("HEADLESS", "true").lower() != "false"
+    return playwright.chromium.launch(headless=headless, args=LEAN_BROWSER_ARGS)
+
+def new_lean_context(browser, blocker=None):
+    """
+    Create a browser context with request blocking attached.
+    Service workers are blocked so every request goes through the route handler.
+    """
+    context = browser.new_context(service_workers="block")
+    if blocker is None:
+        blocker = RequestBlocker()
+    blocker.attach(context)
+    return context, blocker
+
 # Login Function
 def login(page, email, password):
     logger.info("Attempting to log in.")
     try:
-        page.goto("https://www.dice.com/dashboard/login")
+        page.goto(f"{DICE_BASE_URL}/dashboard/login")
         page.wait_for_load_state("load")
         time.sleep(3)
 
@@ -116,30 +272,72 @@ def generate_search_query_components(resume_text):
         logger.error(f"Error generating search query components: {e}")
         raise RuntimeError(f"Error generating search query components: {e}")
 
+DATE_SORT_PATTERN = re.compile(r"date\s*posted|posted\s*date|newest|most\s*recent|\bdate\b", re.I)
+DATE_SORT_URL_PATTERN = re.compile(r"[?&]sort(?:by|order)?=[^&]*(?:date|posted|newest|recent)", re.I)
+SORT_OPTION_SELECTOR = "[role='option'], [role='menuitem'], [role='menuitemradio'], [role='radio']"
+
+def _date_sort_confirmed(page, sort_sel=None):
+    """Read the applied sort back from the URL, the select, or the sort button label."""
+    if DATE_SORT_URL_PATTERN.search(page.url or ""):
+        return True
+    try:
+        if sort_sel is not None:
+            selected = sort_sel.evaluate("e => `${e.value} ${e.options[e.selectedIndex]?.text || ''}`")
+        else:
+            selected = page.get_by_role("button", name=re.compile(r"Sort", re.I)).first.inner_text(timeout=2000)
+    except Exception:
+        return False
+    return bool(DATE_SORT_PATTERN.search(selected or ""))
+
+# Sort results newest first; returns True only if the sort reads back as a date sort
+def _sort_results_by_date(page):
+    try:
+        sort_sel = page.locator("select[id^='sort']").first
+        sort_sel.wait_for(timeout=5000)
+        try:
+            sort_sel.select_option(label="Date Posted")
+        except Exception:
+            sort_sel.select_option(value="date")
+        page.wait_for_load_state("networkidle")
+        if _date_sort_confirmed(page, sort_sel):
+            return True
+    except Exception:
+        pass
+    try:
+        page.get_by_role("button", name=re.compile(r"Sort", re.I)).first.click(timeout=5000)
+        # Only menu options, so a job card mentioning "newest" can't be clicked by mistake
+        page.locator(SORT_OPTION_SELECTOR).filter(has_text=re.compile(r"Date\s*Posted|Newest", re.I)).first.click(timeout=5000)
+        page.wait_for_load_state("networkidle")
+        if _date_sort_confirmed(page):
+            return True
+        logger.warning("Sort by date posted could not be confirmed.")
+    except Exception as e:
+        logger.warning(f"Could not sort results by date posted: {e}")
+    return False
+
 # Job Search Function
-def perform_job_search(page, search_query, location):
+def perform_job_search(page, search_query, location, sort_by_date=False):
+    """Run the search with filters; returns True if results are sorted newest first."""
     logger.info("Performing job search.")
     try:
         # Be generous with timeouts on slow CDNs
         page.set_default_timeout(30000)
 
         # Go straight to Jobs, wait for JS to settle
-        page.goto("https://www.dice.com/jobs", wait_until="domcontentloaded")
+        page.goto(f"{DICE_BASE_URL}/jobs", wait_until="domcontentloaded")
         page.wait_for_load_state("networkidle")
 
         # --- Handle cookie/consent overlays (ignore if not present)
-        for sel in [
-            "button:has-text('Accept')",
-            "button:has-text('I Accept')",
-            "button:has-text('Agree')",
-            "text=Accept All",
-        ]:
+        misses = 0
+        for sel in SELECTOR_CACHE.order("cookie_consent", COOKIE_CONSENT_SELECTORS):
             try:
                 page.locator(sel).first.wait_for(timeout=2000)
                 page.locator(sel).first.click()
+                SELECTOR_CACHE.record_hit("cookie_consent", sel, COOKIE_CONSENT_SELECTORS, misses, 2.0)
                 break
             except Exception:
-                pass
+                SELECTOR_CACHE.record_miss("cookie_consent", sel)
+                misses += 1
 
         # --- Robust selectors for the two search boxes
         job_box = page.locator("input[placeholder='Job title, skill, company, keyword']").first
@@ -221,8 +419,11 @@ def perform_job_search(page, search_query, location):
         except Exception as e:
             logger.warning(f"Could not set page size to 100: {e}")
 
+        sorted_by_date = _sort_results_by_date(page) if sort_by_date else False
+
         time.sleep(2)
         logger.info("Job search completed successfully.")
+        return sorted_by_date
     except Exception as e:
         logger.error(f"Error during job search: {e}")
         raise
@@ -243,6 +444,13 @@ NEXT_BUTTON_SELECTORS = [
     "button[aria-label='Next']",
 ]
 
+COOKIE_CONSENT_SELECTORS = [
+    "button:has-text('Accept')",
+    "button:has-text('I Accept')",
+    "button:has-text('Agree')",
+    "text=Accept All",
+]
+
 RESULT_CONTAINER_SELECTORS = [
     "[data-cy='search-card']",
     "article[data-cy='search-card']",
@@ -282,31 +490,150 @@ def _extract_job_id_from_attrs(elem):
         pass
     return None
 
-def _wait_for_any_selector(page, selectors, timeout=15000):
-    """Wait until any of the selectors appears visible."""
+# Learned Selector Cache
+SELECTOR_CACHE_PATH = os.getenv("SELECTOR_CACHE_PATH", "selector_cache.json")
+
+class SelectorCache:
+    """
+    Remembers which fallback selector matched for each page type and tries it first next time.
+    With probability `revalidate_rate` the default order is used instead, so a Dice A/B
+    switch to another candidate is picked up. A winner that misses `max_misses` times in a
+    row without matching again is dropped. Persisted as JSON between runs.
+    """
+
+    def __init__(self, path=SELECTOR_CACHE_PATH, revalidate_rate=0.1, max_misses=3, rng=None):
+        self.path = path
+        self.revalidate_rate = revalidate_rate
+        self.max_misses = max_misses
+        self.rng = rng or random.Random()
+        self.entries = self._load()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start per-run counters from zero; learned entries are kept."""
+        self.lookups = 0
+        self.revalidations = 0
+        self.seconds_saved = 0.0
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable selector cache {self.path}: {e}")
+            return {}
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump(self.entries, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save selector cache {self.path}: {e}")
+
+    def _entry(self, page_type, selector):
+        return self.entries.setdefault(page_type, {}).setdefault(selector, {"hits": 0, "misses": 0, "last_hit": 0.0})
+
+    def best(self, page_type, candidates):
+        """Most recently matched candidate that hasn't gone stale, or None."""
+        known = self.entries.get(page_type, {})
+        matched = [
+            c for c in candidates
+            if known.get(c, {}).get("hits") and known[c].get("misses", 0) < self.max_misses
+        ]
+        if not matched:
+            return None
+        return max(matched, key=lambda c: known[c]["last_hit"])
+
+    def order(self, page_type, candidates):
+        """Candidates in the order they should be tried."""
+        self.lookups += 1
+        candidates = list(candidates)
+        if self.rng.random() < self.revalidate_rate:
+            self.revalidations += 1
+            return candidates
+        best = self.best(page_type, candidates)
+        if best is None:
+            return candidates
+        return [best] + [c for c in candidates if c != best]
+
+    def record_miss(self, page_type, selector):
+        # Consecutive misses since the last hit
+        self._entry(page_type, selector)["misses"] += 1
+
+    def record_hit(self, page_type, selector, candidates, misses_before_hit, miss_timeout):
+        """
+        Record a match. Savings are net: timeouts the fixed order would have burned
+        minus the ones actually burned (negative when a stale winner is re-checked).
+        """
+        entry = self._entry(page_type, selector)
+        entry["hits"] += 1
+        entry["misses"] = 0
+        entry["last_hit"] = time.time()
+        default_misses = list(candidates).index(selector)
+        self.seconds_saved += (default_misses - misses_before_hit) * miss_timeout
+
+    def summary(self):
+        return {
+            "lookups": self.lookups,
+            "revalidations": self.revalidations,
+            "timeout_seconds_saved": round(self.seconds_saved, 1),
+        }
+
+    def log_summary(self):
+        stats = self.summary()
+        logger.info(
+            f"Selector cache saved ~{stats['timeout_seconds_saved']}s of selector timeouts "
+            f"over {stats['lookups']} lookups ({stats['revalidations']} re-validations)."
+        )
+        return stats
+
+SELECTOR_CACHE = SelectorCache()
+
+def _wait_for_any_selector(page, selectors, timeout=15000, page_type=None):
+    """
+    Wait until any of the selectors appears visible.
+    With a page_type, the selector cache picks the try order and learns the winner.
+    """
     last_error = None
     slice_timeout = max(1500, timeout // max(1, len(selectors)))
+    ordered = SELECTOR_CACHE.order(page_type, selectors) if page_type else list(selectors)
+    misses = 0
     for _ in range(2):  # two passes increases odds during slow loads
-        for sel in selectors:
+        for sel in ordered:
             try:
                 page.locator(sel).first.wait_for(state="visible", timeout=slice_timeout)
+                if page_type:
+                    SELECTOR_CACHE.record_hit(page_type, sel, selectors, misses, slice_timeout / 1000)
                 return sel
             except Exception as e:
                 last_error = e
+                misses += 1
+                if page_type:
+                    SELECTOR_CACHE.record_miss(page_type, sel)
     if last_error:
         raise last_error
 
-def extract_job_ids(page, max_pages=20, sleep_after_action=1.0):
+def extract_job_ids(page, max_pages=20, sleep_after_action=1.0, known_ids=None, stop_after_known=3):
     """
     Collect job IDs across the result list.
     Works with both infinite scroll and paginated UIs that Dice A/B tests.
+    With known_ids (incremental mode, results sorted newest first), pagination stops once
+    `stop_after_known` previously seen IDs show up, and only unseen IDs are returned.
     """
-    job_ids = set()
+    known_ids = set(known_ids or ())
+    stop_after_known = min(stop_after_known, len(known_ids))
+    job_ids = {}  # insertion-ordered, newest first when sorted by date
     seen_links_count = 0
     stagnant_rounds = 0
 
     # Ensure results are present before starting
-    _wait_for_any_selector(page, RESULT_CONTAINER_SELECTORS + JOB_LINK_SELECTORS, timeout=30000)
+    _wait_for_any_selector(page, RESULT_CONTAINER_SELECTORS + JOB_LINK_SELECTORS, timeout=30000, page_type="search_results")
 
     for page_idx in range(max_pages):
         # Give time for lazy cards to render
@@ -326,12 +653,20 @@ def extract_job_ids(page, max_pages=20, sleep_after_action=1.0):
 
         # Extract IDs
         new_on_this_page = 0
+        known_on_this_page = set()
         for a in links:
             jid = _extract_job_id_from_attrs(a)
+            if jid and jid in known_ids:
+                known_on_this_page.add(jid)
             if jid and jid not in job_ids:
-                job_ids.add(jid)
+                job_ids[jid] = None
                 new_on_this_page += 1
 
+        # Incremental mode: everything past previously seen jobs is older, so stop here
+        if known_ids and len(known_on_this_page) >= stop_after_known:
+            logger.info(f"Reached previously seen jobs on result page {page_idx + 1}; stopping pagination.")
+            break
+
         # Heuristic to stop if nothing new is being added
         if len(job_ids) == seen_links_count:
             stagnant_rounds += 1
@@ -341,11 +676,18 @@ def extract_job_ids(page, max_pages=20, sleep_after_action=1.0):
 
         # Try to advance: click Next/Load more if present; otherwise infinite scroll
         advanced = False
-        for nsel in NEXT_BUTTON_SELECTORS:
+        misses = 0
+        for nsel in SELECTOR_CACHE.order("next_button", NEXT_BUTTON_SELECTORS):
             try:
                 btn = page.locator(nsel).first
                 # visible and not disabled
-                btn.wait_for(state="visible", timeout=1500)
+                try:
+                    btn.wait_for(state="visible", timeout=1500)
+                except Exception:
+                    SELECTOR_CACHE.record_miss("next_button", nsel)
+                    misses += 1
+                    continue
+                # A visible but disabled button (last page) is neither a hit nor a timeout
                 disabled = False
                 try:
                     disabled = btn.is_disabled()
@@ -359,6 +701,7 @@ def extract_job_ids(page, max_pages=20, sleep_after_action=1.0):
                         pass
                 if not disabled:
                     btn.click()
+                    SELECTOR_CACHE.record_hit("next_button", nsel, NEXT_BUTTON_SELECTORS, misses, 1.5)
                     advanced = True
                     break
             except Exception:
@@ -386,27 +729,343 @@ def extract_job_ids(page, max_pages=20, sleep_after_action=1.0):
         if stagnant_rounds >= 3 and new_on_this_page == 0:
             break
 
+    if known_ids:
+        fresh_ids = [jid for jid in job_ids if jid not in known_ids]
+        logger.info(f"Extracted {len(fresh_ids)} new job IDs ({len(job_ids) - len(fresh_ids)} already seen).")
+        return fresh_ids
     logger.info(f"Extracted {len(job_ids)} job IDs.")
     return list(job_ids)
 
+# Incremental Search History
+SEARCH_HISTORY_PATH = os.getenv("SEARCH_HISTORY_PATH", "search_history.json")
+
+class SearchHistory:
+    """
+    Newest job IDs seen per (resume, location), with first-seen timestamps, persisted as JSON.
+    Feeds extract_job_ids(known_ids=...) so repeat runs stop at the previous run's frontier.
+    Keyed on a hash of the resume text rather than the search query, because the query is
+    regenerated by GPT on every run and rarely repeats verbatim.
+    """
+
+    def __init__(self, path=SEARCH_HISTORY_PATH, max_ids=200):
+        self.path = path
+        self.max_ids = max_ids
+        self.searches = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as file:
+                    self.searches = json.load(file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable search history {path}: {e}")
+
+    @staticmethod
+    def _key(resume_text, location):
+        resume_hash = hashlib.sha256(" ".join(resume_text.split()).encode("utf-8")).hexdigest()[:16]
+        return f"{resume_hash} || {(location or '').strip().lower()}"
+
+    def known_ids(self, resume_text, location):
+        return list(self.searches.get(self._key(resume_text, location), {}).get("jobs", {}))
+
+    def last_run(self, resume_text, location):
+        return self.searches.get(self._key(resume_text, location), {}).get("last_run")
+
+    def record(self, resume_text, location, job_ids):
+        """Add job IDs that were actually scraped and evaluated (newest first); keep the newest max_ids."""
+        entry = self.searches.setdefault(self._key(resume_text, location), {"jobs": {}, "last_run": None})
+        now = datetime.now().astimezone().isoformat(timespec="seconds")
+        jobs = {jid: now for jid in job_ids if jid not in entry["jobs"]}
+        jobs.update(entry["jobs"])
+        entry["jobs"] = dict(list(jobs.items())[:self.max_ids])
+        entry["last_run"] = now
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump(self.searches, file, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save search history {self.path}: {e}")
+
+# Adaptive Concurrency and Circuit Breaker
+# Text that means Dice stopped serving real pages to us
+BLOCK_PAGE_MARKERS = [
+    "captcha",
+    "verify you are human",
+    "are you a robot",
+    "unusual traffic",
+    "access denied",
+]
+
+LOGIN_WALL_URL_PATTERN = re.compile(r"/(?:dashboard/)?login\b", re.I)
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker has tripped too many times to keep going."""
+
+def detect_block_page(page):
+    """Return 'login_wall', 'captcha', or None for the page currently loaded."""
+    try:
+        if LOGIN_WALL_URL_PATTERN.search(page.url or ""):
+            return "login_wall"
+        text = page.evaluate("document.body ? document.body.innerText.slice(0, 5000) : ''") or ""
+    except Exception:
+        return None
+    text = text.lower()
+    if any(marker in text for marker in BLOCK_PAGE_MARKERS):
+        return "captcha"
+    return None
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive timeouts/errors, or immediately on a
+    CAPTCHA/login wall. After `cooldown` seconds it goes half-open and lets one probe through.
+    """
+
+    def __init__(self, failure_threshold=3, cooldown=60.0, max_trips=3, clock=time.monotonic, sleep=time.sleep):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self.clock = clock
+        self.sleep = sleep
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = None
+
+    def record_success(self):
+        # Stragglers from a batch that tripped the breaker must not skip the cooldown
+        if self.state == "open":
+            return
+        if self.state == "half_open":
+            logger.info("Circuit breaker closed after successful probe.")
+        self.state = "closed"
+        self.consecutive_failures = 0
+
+    def record_failure(self, reason="timeout"):
+        if self.state == "open":
+            return
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            self.trip(reason)
+
+    def trip(self, reason):
+        self.state = "open"
+        self.opened_at = self.clock()
+        self.trips += 1
+        self.consecutive_failures = 0
+        logger.warning(f"Circuit breaker opened ({reason}); trip {self.trips}/{self.max_trips}, cooling down {self.cooldown:.0f}s.")
+
+    def wait_until_ready(self):
+        """Block through the cooldown if open; raise once the trip budget is spent."""
+        if self.state != "open":
+            return
+        if self.trips >= self.max_trips:
+            raise CircuitOpenError(f"Circuit breaker tripped {self.trips} times; giving up for this run.")
+        remaining = self.cooldown - (self.clock() - self.opened_at)
+        if remaining > 0:
+            self.sleep(remaining)
+        self.state = "half_open"
+        logger.info("Circuit breaker half-open; sending a single probe.")
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller for how many Dice pages are in flight at once.
+    Additive increase after a clean, fast batch; multiplicative decrease on errors or slow pages.
+    """
+
+    def __init__(self, initial=2, min_limit=1, max_limit=6, increase=1, decrease_factor=0.5,
+                 latency_target=10.0, breaker=None):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.breaker = breaker or CircuitBreaker()
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self.decisions = []
+
+    @property
+    def limit(self):
+        # A half-open breaker only gets one probe
+        if self.breaker.state == "half_open":
+            return 1
+        return int(self._limit)
+
+    def record(self, latency, outcome):
+        """
+        Feed one page result to the breaker: 'ok', 'missing', 'timeout', 'error', 'captcha'
+        or 'login_wall'. Returns True if this result opened the breaker.
+        'missing' (page loaded, expected content absent) is a markup problem, not throttling.
+        """
+        was_open = self.breaker.state == "open"
+        if outcome in ("ok", "missing"):
+            self.breaker.record_success()
+        elif outcome in ("captcha", "login_wall"):
+            if not was_open:
+                self.breaker.trip(outcome)
+        elif outcome in ("timeout", "error"):
+            self.breaker.record_failure(outcome)
+        return not was_open and self.breaker.state == "open"
+
+    def adjust(self, latencies, outcomes):
+        """Apply one AIMD step from a finished batch and log the decision."""
+        previous = int(self._limit)
+        failures = sum(1 for o in outcomes if o not in ("ok", "missing"))
+        slowest = max(latencies) if latencies else 0.0
+        if failures or slowest > self.latency_target:
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            action = "decrease"
+        else:
+            self._limit = min(self.max_limit, self._limit + self.increase)
+            action = "increase"
+        decision = {
+            "action": action,
+            "from": previous,
+            "to": int(self._limit),
+            "failures": failures,
+            "max_latency": round(slowest, 2),
+            "breaker": self.breaker.state,
+        }
+        self.decisions.append(decision)
+        logger.info(
+            f"Concurrency {action}: {previous} -> {int(self._limit)} "
+            f"(failures={failures}, max_latency={slowest:.2f}s, breaker={self.breaker.state})"
+        )
+        return decision
+
+    def summary(self):
+        return {
+            "final_limit": self.limit,
+            "breaker_trips": self.breaker.trips,
+            "decisions": list(self.decisions),
+        }
+
+def _start_navigation(page, url):
+    """
+    Start loading url without waiting for the response, so several pages can be in flight.
+    The sync API's goto() blocks until response headers arrive, which would serialize a batch.
+    """
+    # about:blank is local and instant; it guarantees wait_for_url can't match a stale document
+    page.goto("about:blank")
+    try:
+        page.evaluate("url => { window.location.assign(url); }", url)
+    except Exception as e:
+        # The navigation can tear down the context before evaluate returns; that still counts as started
+        if "context was destroyed" not in str(e):
+            raise
+
+def _load_job_description(page, job_id, nav_statuses, timeout=15000, render_timeout=5000):
+    """
+    Wait for a started navigation to land and return (text, outcome).
+    'timeout' means the page never loaded; 'missing' means it loaded without a description
+    (expired posting or markup change).
+    """
+    try:
+        page.wait_for_url(re.compile(f"/job-detail/{re.escape(job_id)}"), wait_until="domcontentloaded", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return "", detect_block_page(page) or "timeout"
+    except Exception as e:
+        logger.warning(f"Error loading job ID {job_id}: {e}")
+        return "", detect_block_page(page) or "error"
+
+    status = nav_statuses.get(page)
+    if status is not None and status >= 500:
+        return "", "error"
+    try:
+        page.wait_for_selector('div.job-description', timeout=render_timeout)
+        return page.query_selector('div.job-description').inner_text(), "ok"
+    except PlaywrightTimeoutError:
+        return "", detect_block_page(page) or "missing"
+
 # Scrape Job Descriptions
-def scrape_job_descriptions(page, job_ids):
+def scrape_job_descriptions(page, job_ids, controller=None):
+    """
+    Scrape descriptions with up to `controller.limit` pages loading in parallel.
+    Results keep the order of job_ids. When the breaker trips, the rest of the batch goes back
+    on the queue and is retried after the cooldown.
+    """
     if not isinstance(job_ids, list):
         logger.error("Job IDs should be passed as a list.")
-    
-    job_descriptions = []
-    for job_id in job_ids:
-        job_url = f"https://www.dice.com/job-detail/{job_id}"
-        page.goto(job_url)
-        time.sleep(2)
-        job_desc_element = page.query_selector('div.job-description')
-        if job_desc_element:
-            #print(f"Scraped Job Description for ID {job_id}:\n{job_desc_element.inner_text()}\n")
-            job_descriptions.append(job_desc_element.inner_text())
-        else:
-            job_descriptions.append("")  # Add empty description if not found
-            print(f"No Job Description found for ID {job_id}.\n")
-    return job_descriptions
+    if controller is None:
+        controller = AdaptiveConcurrency()
+
+    descriptions = {}
+    pending = list(job_ids)
+    workers = []
+    nav_statuses = {}
+    listeners = []
+
+    def add_worker(worker):
+        # Remember the main-document status of each worker's latest navigation
+        def on_response(response):
+            if response.request.is_navigation_request() and response.frame.parent_frame is None:
+                nav_statuses[worker] = response.status
+        worker.on("response", on_response)
+        listeners.append((worker, on_response))
+        workers.append(worker)
+
+    add_worker(page)
+    try:
+        while pending:
+            try:
+                controller.breaker.wait_until_ready()
+            except CircuitOpenError as e:
+                logger.error(f"{e} {len(pending)} job descriptions left unscraped.")
+                break
+
+            batch = pending[:controller.limit]
+            while len(workers) < len(batch):
+                add_worker(page.context.new_page())
+
+            # Kick off every navigation first so the pages load concurrently
+            started, failed = {}, set()
+            for job_id, worker in zip(batch, workers):
+                nav_statuses.pop(worker, None)
+                started[job_id] = time.monotonic()
+                try:
+                    _start_navigation(worker, f"{DICE_BASE_URL}/job-detail/{job_id}")
+                except Exception as e:
+                    logger.warning(f"Navigation failed for job ID {job_id}: {e}")
+                    failed.add(job_id)
+
+            latencies, outcomes, requeue = [], [], []
+            for position, (job_id, worker) in enumerate(zip(batch, workers)):
+                if job_id in failed:
+                    text, outcome = "", "error"
+                else:
+                    text, outcome = _load_job_description(worker, job_id, nav_statuses)
+                latency = time.monotonic() - started[job_id]
+                latencies.append(latency)
+                outcomes.append(outcome)
+                if controller.record(latency, outcome):
+                    # Stop the batch; the tripping job and everything after it wait for the cooldown
+                    requeue = batch[position:]
+                    break
+                if outcome in ("captcha", "login_wall"):
+                    requeue.append(job_id)
+                    continue
+                descriptions[job_id] = text
+                if not text:
+                    print(f"No Job Description found for ID {job_id}.\n")
+
+            controller.adjust(latencies, outcomes)
+            pending = requeue + pending[len(batch):]
+    finally:
+        for worker, on_response in listeners:
+            try:
+                worker.remove_listener("response", on_response)
+            except Exception:
+                pass
+        for worker in workers[1:]:
+            try:
+                worker.close()
+            except Exception:
+                pass
+
+    # Add empty description for anything not scraped
+    return [descriptions.get(job_id, "") for job_id in job_ids]
 
 # Preprocessing Function
 def preprocess_text(text):
@@ -440,7 +1099,8 @@ def compute_similarity(resume_text, job_descriptions, job_ids):
     return results
 
 
-def write_job_titles_to_file(page, job_id, url):
+def write_job_titles_to_file(page, job_id, url, controller=None):
+    """Log the job title and run the Easy Apply flow; returns True only if the application went through."""
     logger.info("Writing job titles to file.")
     try:
         val = 0
@@ -451,11 +1111,29 @@ def write_job_titles_to_file(page, job_id, url):
         
         with open('job_titles.txt', 'a') as file:
             if job_id:
-                job_url = f"https://www.dice.com/job-detail/{job_id}"
+                job_url = f"{DICE_BASE_URL}/job-detail/{job_id}"
                 try:
                     new_page = page.context.new_page()
-                    new_page.goto(job_url)
-                    new_page.wait_for_load_state("load")
+                    started = time.monotonic()
+                    try:
+                        new_page.goto(job_url)
+                        new_page.wait_for_load_state("load")
+                    except PlaywrightTimeoutError:
+                        if controller is not None:
+                            controller.record(time.monotonic() - started, "timeout")
+                        raise
+                    if controller is not None:
+                        # Only look for a block page when the job content didn't render
+                        try:
+                            new_page.wait_for_selector('apply-button-wc, div.job-description', timeout=10000)
+                            outcome = "ok"
+                        except PlaywrightTimeoutError:
+                            outcome = detect_block_page(new_page) or "missing"
+                        controller.record(time.monotonic() - started, outcome)
+                        if outcome in ("captcha", "login_wall"):
+                            logger.warning(f"Hit {outcome} on job ID {job_id}; skipping application.")
+                            new_page.close()
+                            return False
                     time.sleep(3)
 
                     job_title = new_page.evaluate("document.title")
@@ -471,11 +1149,12 @@ def write_job_titles_to_file(page, job_id, url):
                     
                     new_page.wait_for_selector('apply-button-wc')
                     val += 1
-                    evaluate_and_apply(new_page, val)
+                    return evaluate_and_apply(new_page, val)
                 except Exception as e:
                     logger.error(f"Error processing job ID {job_id}: {e}")
     except Exception as e:
         logger.error(f"Error writing job titles to file: {e}")
+    return False
 
 def evaluate_and_apply(page, val):
     js_script = """
@@ -492,7 +1171,7 @@ def evaluate_and_apply(page, val):
                 if (applicationSubmitted) {
                     const appTextElement = applicationSubmitted.shadowRoot.querySelector('p.app-text');
                     if (appTextElement && appTextElement.textContent.includes('Application Submitted')) {
-                        value = 0;
+                        value = 2;
                     } else {
                         value = 1;
                     }
@@ -507,8 +1186,10 @@ def evaluate_and_apply(page, val):
     """
     returned_value = page.evaluate(js_script)
 
+    # 1: wizard needs to be completed, 2: Easy Apply submitted straight away, 0: no Easy Apply
     if returned_value == 1:
-        apply_and_upload_resume(page, val)
+        return apply_and_upload_resume(page, val)
+    return returned_value == 2
 
 
 def apply_and_upload_resume(page, val):
@@ -563,16 +1244,16 @@ def apply_and_upload_resume(page, val):
                             time.sleep(3)
                         else:
                             print("Next button after uploading resume not found.")
-                            return
+                            return False
                     else:
                         print("Resume upload confirmation button not found.")
-                        return
+                        return False
                 else:
                     print("File input element not found.")
-                    return
+                    return False
             else:
                 print("Upload button not found.")
-                return
+                return False
         else:
             print("Resume already uploaded. Proceeding to submit.")
 
@@ -583,16 +1264,41 @@ def apply_and_upload_resume(page, val):
             submit_button.click()
             print(f"Job application submitted") #for job ID: {val}")
             page.close()
-        else:
-            print("Submit button not found or incorrect selector.")
+            return True
+        print("Submit button not found or incorrect selector.")
     else:
         print("Next button not found.")
+    return False
+
+# Apply to Matching Jobs
+def apply_to_matching_jobs(page, similarity_results, threshold, controller, scraped_ids):
+    """
+    Apply to every job at or above threshold. Returns the scraped job IDs that reached a final
+    decision (applied, or below threshold) so incremental history only marks those as seen;
+    failed or unattempted applications are offered again next run.
+    """
+    decided_ids = []
+    for job_id, similarity in similarity_results:
+        if similarity >= threshold:
+            try:
+                controller.breaker.wait_until_ready()
+            except CircuitOpenError as e:
+                logger.error(f"Stopping applications: {e}")
+                break
+            print(f"Applying for job {job_id} with similarity {similarity:.2f}")
+            decided = write_job_titles_to_file(page, job_id, "https://www.dice.com/jobs", controller)
+        else:
+            print(f"Skipped job {job_id} with similarity {similarity:.2f}")
+            decided = True
+        if decided and job_id in scraped_ids:
+            decided_ids.append(job_id)
+    return decided_ids
 
 
 def logout_and_close(page, browser):
     logger.info("Logging out and closing browser.")
     try:
-        page.goto("https://www.dice.com/dashboard/login")
+        page.goto(f"{DICE_BASE_URL}/dashboard/login")
         menu_settings = page.query_selector('//*[@data-id="menu-settings"]')
         if menu_settings:
             menu_settings.click()
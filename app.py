@@ -13,6 +13,8 @@ from PyPDF2 import PdfReader
 from flask import Flask, jsonify, request
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from contextlib import nullcontext
+from run_profiler import RunProfiler, PROFILE_FOLDER
 from DiceAutomation import(
     login,
     extract_resume_text,
@@ -25,7 +27,13 @@ from DiceAutomation import(
     write_job_titles_to_file,
     evaluate_and_apply,
     apply_and_upload_resume,
-    logout_and_close
+    logout_and_close,
+    launch_lean_browser,
+    new_lean_context,
+    AdaptiveConcurrency,
+    SELECTOR_CACHE,
+    SearchHistory,
+    apply_to_matching_jobs
 )
 app = Flask(__name__)
 
@@ -46,20 +54,45 @@ UPLOAD_FOLDER = './uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+TRUTHY_VALUES = ('1', 'true', 'yes', 'on')
+
+def profiling_requested(req):
+    """Profile this run if the 'profile' form field or 'X-Profile-Run' header is truthy."""
+    return (
+        (req.form.get('profile') or '').lower() in TRUTHY_VALUES
+        or (req.headers.get('X-Profile-Run') or '').lower() in TRUTHY_VALUES
+    )
+
+def run_summaries(blocker, controller):
+    """Savings and throttling stats for the run so far; safe to call after a failure."""
+    summaries = {}
+    if blocker is not None:
+        summaries["network_savings"] = blocker.log_summary()
+    if controller is not None:
+        summaries["concurrency"] = controller.summary()
+    SELECTOR_CACHE.save()
+    summaries["selector_cache"] = SELECTOR_CACHE.log_summary()
+    return summaries
+
 # Main Workflow
 @app.route('/automate-dice', methods=['GET', 'POST'])
 def main():
     if request.method == 'POST':
+        profiler = RunProfiler(PROFILE_FOLDER) if profiling_requested(request) else None
+        blocker = controller = None
+        SELECTOR_CACHE.reset_stats()
         try:
-            with sync_playwright() as playwright:
-                browser = playwright.chromium.launch(headless=False)
-                context = browser.new_context()
+            with profiler or nullcontext(), sync_playwright() as playwright:
+                browser = launch_lean_browser(playwright)
+                context, blocker = new_lean_context(browser)
                 page = context.new_page()
+                controller = AdaptiveConcurrency()
 
                 email = request.form.get('email')
                 password = request.form.get('password')
                 threshold = request.form.get('threshold')
                 location = request.form.get('location')
+                incremental = (request.form.get('incremental') or '').lower() in TRUTHY_VALUES
 
                 if 'resume' not in request.files:
                     return jsonify({"error": "No resume file provided"}), 400
@@ -80,31 +113,46 @@ def main():
                 search_query = f'({" OR ".join(job_titles)}) OR ({" OR ".join(skills)})'
                 #search_query = ("Java Full-Stack Developer")
                 logger.info(f"Generated search query: {search_query}")
-                perform_job_search(page, search_query, location)
+                sorted_by_date = perform_job_search(page, search_query, location, sort_by_date=incremental)
 
-                job_ids = extract_job_ids(page)
+                # Incremental mode only trusts the stop condition when results are newest first
+                history = SearchHistory() if incremental else None
+                known_ids = history.known_ids(resume_text, location) if sorted_by_date else None
+                if incremental and not sorted_by_date:
+                    logger.warning("Results could not be sorted by date; running a full search.")
+                job_ids = extract_job_ids(page, known_ids=known_ids)
 
                 if job_ids:
-                    job_descriptions = scrape_job_descriptions(page, job_ids)
+                    job_descriptions = scrape_job_descriptions(page, job_ids, controller)
                 else:
+                    job_descriptions = []
                     logger.error("No job IDs were extracted. Skipping job description scraping.")
 
                 similarity_results = compute_similarity(resume_text, job_descriptions, job_ids)
 
+                # Only jobs whose description was scraped and that reached a decision count as seen
+                scraped_ids = {job_id for job_id, job_desc in zip(job_ids, job_descriptions) if job_desc}
+
                 # Apply for jobs that meet the similarity threshold
-                for job_id, similarity in similarity_results:
-                    if similarity >= float(threshold):
-                        print(f"Applying for job {job_id} with similarity {similarity:.2f}")
-                        write_job_titles_to_file(page, job_id, "https://www.dice.com/jobs")
-                    else:
-                        print(f"Skipped job {job_id} with similarity {similarity:.2f}")
+                decided_ids = apply_to_matching_jobs(page, similarity_results, float(threshold), controller, scraped_ids)
+
+                if history:
+                    history.record(resume_text, location, decided_ids)
+                    history.save()
 
                 logout_and_close(page, browser)
 
-            return {"status": "success", "message": "Automation completed successfully."}, 200
+            result, status = {"status": "success", "message": "Automation completed successfully."}, 200
         except Exception as e:
             logger.error(f"An error occurred: {str(e)}")
-            return {"status": "error", "message": f"An error occurred: {str(e)}"}, 500
+            result, status = {"status": "error", "message": f"An error occurred: {str(e)}"}, 500
+        finally:
+            summaries = run_summaries(blocker, controller)
+
+        result.update(summaries)
+        if profiler:
+            result["profile"] = profiler.summary()
+        return result, status
 
 
 # Run the main function
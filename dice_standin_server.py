@@ -0,0 +1,101 @@
+import argparse
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger()
+
+# Local stand-in for Dice job-detail pages that injects latency, errors and CAPTCHA walls.
+# It only serves /job-detail/<id>, which is what scrape_job_descriptions and the apply step load;
+# login and search still need the real site. tests/test_adaptive_concurrency.py drives it.
+#
+# Faults are injected at random (--error-rate etc.) or per job by ID prefix:
+#   error-*         503 Service Unavailable
+#   stall-*         hang for --stall-seconds, then 504
+#   captcha-*       CAPTCHA page on every request
+#   captcha-once-*  CAPTCHA page on the first request only, then the real job
+#   expired-*       200 page without a job description
+
+EXPIRED_PAGE = """<html><head><title>Job no longer available</title></head>
+<body><p>This job is no longer available.</p></body></html>"""
+
+JOB_PAGE = """<html><head><title>Stand-in Job {job_id}</title></head>
+<body><div class="job-description">Stand-in description for job {job_id}. Python, SQL, cloud.</div></body></html>"""
+
+CAPTCHA_PAGE = """<html><head><title>Security check</title></head>
+<body><p>Please verify you are human to continue.</p></body></html>"""
+
+def make_handler(latency=1.0, jitter=0.0, error_rate=0.0, stall_rate=0.0, captcha_rate=0.0, stall_seconds=30.0):
+    seen_paths = set()
+    seen_lock = threading.Lock()
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def _send(self, status, body):
+            payload = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _stall(self):
+            # Hold the connection long enough to trip the client timeout
+            time.sleep(stall_seconds)
+            self._send(504, "<html><body>Gateway Timeout</body></html>")
+
+        def do_GET(self):
+            if not self.path.startswith("/job-detail/"):
+                self._send(404, "<html><body>Not Found</body></html>")
+                return
+            job_id = self.path.rsplit("/", 1)[-1]
+            with seen_lock:
+                first_visit = self.path not in seen_paths
+                seen_paths.add(self.path)
+
+            time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)))
+            roll = random.random()
+            if job_id.startswith("stall-") or roll < stall_rate:
+                self._stall()
+            elif job_id.startswith("error-") or roll < stall_rate + error_rate:
+                self._send(503, "<html><body>Service Unavailable</body></html>")
+            elif (job_id.startswith("captcha-once-") and first_visit) or (
+                job_id.startswith("captcha-") and not job_id.startswith("captcha-once-")
+            ) or roll < stall_rate + error_rate + captcha_rate:
+                self._send(200, CAPTCHA_PAGE)
+            elif job_id.startswith("expired-"):
+                self._send(200, EXPIRED_PAGE)
+            else:
+                self._send(200, JOB_PAGE.format(job_id=job_id))
+
+        def log_message(self, format, *args):
+            logger.info(f"{self.address_string()} {format % args}")
+
+    return StandInHandler
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Dice stand-in with injected latency and errors.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=1.0, help="Base response delay in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Uniform +/- jitter on the delay.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 responses.")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of requests that hang past the client timeout.")
+    parser.add_argument("--stall-seconds", type=float, default=30.0)
+    parser.add_argument("--captcha-rate", type=float, default=0.0, help="Fraction of CAPTCHA pages.")
+    args = parser.parse_args()
+
+    handler = make_handler(args.latency, args.jitter, args.error_rate, args.stall_rate, args.captcha_rate, args.stall_seconds)
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    logger.info(f"Dice stand-in listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+
+try:
+    # Installed with Playwright, whose sync API runs on greenlets
+    import greenlet
+except ImportError:
+    greenlet = None
+
+logger = logging.getLogger()
+
+PROFILE_FOLDER = './profiles'
+
+WAITING_MARKER = "[waiting on Playwright IPC]"
+
+class StackSampler(threading.Thread):
+    """
+    Samples one thread's Python stack at a fixed interval and counts collapsed stacks
+    (root;...;leaf), the input format for flamegraph.pl and speedscope.
+
+    Playwright's sync API blocks by switching to a dispatcher greenlet on the same thread,
+    so the thread's live frame is then the asyncio loop. When `target_greenlet` is parked,
+    its suspended stack is prepended so the waiting call site (login, scrape, ...) shows.
+    """
+
+    def __init__(self, target_thread_id, interval=0.005, target_greenlet=None):
+        super().__init__(daemon=True)
+        self.target_thread_id = target_thread_id
+        self.target_greenlet = target_greenlet
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def _frame_label(frame):
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    @classmethod
+    def _stack_labels(cls, frame):
+        """Frame labels from root to leaf."""
+        labels = []
+        while frame is not None:
+            labels.append(cls._frame_label(frame))
+            frame = frame.f_back
+        return labels[::-1]
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            labels = self._stack_labels(sys._current_frames().get(self.target_thread_id))
+            # gr_frame is None while the greenlet is running, set while it is switched out
+            parked = self.target_greenlet.gr_frame if self.target_greenlet is not None else None
+            if parked is not None:
+                labels = self._stack_labels(parked) + [WAITING_MARKER] + labels
+            if labels:
+                self.stacks[";".join(labels)] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+class RunProfiler:
+    """
+    Context manager that profiles one automation run.
+    cProfile gives exact per-function totals (pstats); the sampler gives wall-clock stacks,
+    so time spent blocked on Playwright IPC shows up as well as CPU time.
+
+    cProfile is not greenlet-aware: while a Playwright call waits, the dispatcher greenlet's
+    event-loop frames run on the same profiler stack, which distorts cumulative times of
+    the calling functions. Read blocked time from the collapsed stacks, not from pstats.
+    """
+
+    def __init__(self, output_dir=PROFILE_FOLDER, run_id=None, sample_interval=0.005):
+        self.output_dir = output_dir
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.sample_interval = sample_interval
+        self.pstats_path = os.path.join(output_dir, f"{self.run_id}.pstats")
+        self.collapsed_path = os.path.join(output_dir, f"{self.run_id}.collapsed.txt")
+        self._profiler = None
+        self._sampler = None
+
+    def __enter__(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        logger.info(f"Profiling run {self.run_id}.")
+        run_greenlet = greenlet.getcurrent() if greenlet is not None else None
+        self._sampler = StackSampler(threading.get_ident(), self.sample_interval, run_greenlet)
+        self._sampler.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profiler.disable()
+        self._sampler.stop()
+        try:
+            self._profiler.dump_stats(self.pstats_path)
+            self._sampler.write_collapsed(self.collapsed_path)
+            stats = pstats.Stats(self._profiler)
+            logger.info(f"Saved profile for run {self.run_id}: {self.pstats_path}, {self.collapsed_path}")
+            logger.info(f"Profiled {stats.total_calls} function calls over {stats.total_tt:.2f}s.")
+        except Exception as e:
+            logger.error(f"Failed to save profile for run {self.run_id}: {e}")
+        # Never swallow errors from the profiled run
+        return False
+
+    def summary(self):
+        return {
+            "run_id": self.run_id,
+            "pstats": self.pstats_path,
+            "collapsed_stacks": self.collapsed_path,
+        }
@@ -14,6 +14,8 @@ def main():
     location = st.text_input("Location", placeholder="Enter job location")
     resume_file = st.file_uploader("Upload Resume (PDF only)", type="pdf")
     threshold = st.slider("Threshold", min_value=0.0, max_value=1.0, value=0.8, step=0.01)
+    incremental = st.checkbox("Only new postings since last run", value=False)
+    profile = st.checkbox("Profile this run", value=False)
 
     # Button to trigger API
     if st.button("Submit"):
@@ -27,7 +29,9 @@ def main():
                 "password": (None, password),
                 "location": (None, location),
                 "resume": (resume_file.name, resume_file.getvalue(), "application/pdf"),
-                "threshold": (None, str(threshold))
+                "threshold": (None, str(threshold)),
+                "incremental": (None, "true" if incremental else "false"),
+                "profile": (None, "true" if profile else "false")
             }
 
             # Send POST request to Flask API
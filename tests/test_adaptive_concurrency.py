@@ -0,0 +1,158 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+pytest.importorskip("sentence_transformers")
+
+from playwright.sync_api import sync_playwright, Error as PlaywrightError
+
+import DiceAutomation
+from DiceAutomation import AdaptiveConcurrency, CircuitBreaker, scrape_job_descriptions
+from dice_standin_server import make_handler
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so cooldowns finish instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def start_standin(monkeypatch, **faults):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(**faults))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(DiceAutomation, "DICE_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    return server
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    server = start_standin(monkeypatch, latency=0.2)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def page():
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except PlaywrightError as e:
+            pytest.skip(f"Chromium is not available: {e}")
+        yield browser.new_page()
+        browser.close()
+
+
+def make_controller(clock, **kwargs):
+    breaker = CircuitBreaker(cooldown=60.0, max_trips=kwargs.pop("max_trips", 3), clock=clock, sleep=clock.sleep)
+    return AdaptiveConcurrency(latency_target=30.0, breaker=breaker, **kwargs)
+
+
+def limits(controller):
+    return [(d["action"], d["from"], d["to"]) for d in controller.decisions]
+
+
+def test_clean_batches_increase_limit_additively(standin, page):
+    clock = FakeClock()
+    controller = make_controller(clock, initial=1, max_limit=3)
+    job_ids = [f"ok-{i}" for i in range(6)]
+
+    descriptions = scrape_job_descriptions(page, job_ids, controller)
+
+    assert all(f"job {job_id}" in text for job_id, text in zip(job_ids, descriptions))
+    assert limits(controller) == [("increase", 1, 2), ("increase", 2, 3), ("increase", 3, 3)]
+    assert controller.breaker.trips == 0
+
+
+def test_batch_pages_load_concurrently(monkeypatch, page):
+    server = start_standin(monkeypatch, latency=1.0)
+    try:
+        controller = make_controller(FakeClock(), initial=3, max_limit=3)
+        started = time.monotonic()
+        scrape_job_descriptions(page, ["ok-1", "ok-2", "ok-3"], controller)
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Three 1s responses served one after another would take over 3s
+    assert elapsed < 2.5
+
+
+def test_captcha_trips_breaker_and_recovers_after_cooldown(standin, page):
+    clock = FakeClock()
+    controller = make_controller(clock, initial=2)
+    job_ids = ["ok-1", "captcha-once-2", "ok-3", "ok-4"]
+
+    descriptions = scrape_job_descriptions(page, job_ids, controller)
+
+    assert all(descriptions)
+    assert controller.breaker.trips == 1
+    assert clock.sleeps == [60.0]
+    assert controller.breaker.state == "closed"
+    # Halve on the CAPTCHA, single half-open probe, then additive growth
+    assert limits(controller) == [("decrease", 2, 1), ("increase", 1, 2), ("increase", 2, 3)]
+    assert controller.decisions[0]["breaker"] == "open"
+
+
+def test_success_in_tripped_batch_does_not_close_breaker(standin, page):
+    clock = FakeClock()
+    controller = make_controller(clock, initial=3, max_trips=1)
+
+    descriptions = scrape_job_descriptions(page, ["captcha-1", "ok-2", "ok-3"], controller)
+
+    # The batch stops at the CAPTCHA, so nothing is scraped and the cooldown is never skipped
+    assert descriptions == ["", "", ""]
+    assert controller.breaker.state == "open"
+    assert controller.breaker.trips == 1
+
+
+def test_repeated_server_errors_trip_breaker(standin, page):
+    clock = FakeClock()
+    controller = make_controller(clock, initial=3, max_trips=2)
+
+    descriptions = scrape_job_descriptions(page, ["error-1", "error-2", "error-3"], controller)
+
+    assert descriptions == ["", "", ""]
+    # Third consecutive 503 trips it; the half-open probe fails and trips it again
+    assert controller.breaker.trips == 2
+    assert clock.sleeps == [60.0]
+
+
+def test_missing_description_is_not_a_failure(standin, page):
+    clock = FakeClock()
+    controller = make_controller(clock, initial=1, max_limit=4)
+    job_ids = [f"expired-{i}" for i in range(4)]
+
+    descriptions = scrape_job_descriptions(page, job_ids, controller)
+
+    assert descriptions == ["", "", "", ""]
+    assert controller.breaker.trips == 0
+    assert all(action == "increase" for action, _, _ in limits(controller))
+
+
+def test_success_while_open_does_not_skip_cooldown():
+    clock = FakeClock()
+    controller = make_controller(clock, initial=2)
+
+    assert controller.record(1.0, "captcha") is True
+    assert controller.record(1.0, "ok") is False
+    assert controller.breaker.state == "open"
+
+    controller.breaker.wait_until_ready()
+    assert clock.sleeps == [60.0]
+    assert controller.limit == 1
+    controller.record(1.0, "ok")
+    assert controller.breaker.state == "closed"
@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+pytest.importorskip("sentence_transformers")
+
+import DiceAutomation
+from DiceAutomation import PlaywrightTimeoutError, SelectorCache, extract_job_ids
+
+JOB_LINK = "a[data-cy='card-title-link']"
+NEXT = "button:has-text('Next')"
+ARIA_NEXT = "button[aria-label='Next']"
+
+
+class FakeLink:
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+    def get_attribute(self, name):
+        return self.job_id if name == "data-job-id" else None
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state="visible", timeout=None):
+        if self.selector not in self.page.visible:
+            raise PlaywrightTimeoutError(f"{self.selector} not visible")
+
+    def is_disabled(self):
+        return self.page.on_last_page
+
+    def click(self):
+        self.page.clicks += 1
+        self.page.index += 1
+
+
+class FakeResultsPage:
+    """Paginated results where every Next-style button is disabled on the last page."""
+
+    def __init__(self, pages, next_selectors=(NEXT,)):
+        self.pages = pages
+        self.index = 0
+        self.clicks = 0
+        self.visible = {JOB_LINK, *next_selectors}
+
+    @property
+    def on_last_page(self):
+        return self.index == len(self.pages) - 1
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def query_selector_all(self, selector):
+        if selector != JOB_LINK:
+            return []
+        return [FakeLink(job_id) for job_id in self.pages[self.index]]
+
+    def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    def evaluate(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SelectorCache(path="", revalidate_rate=0.0, rng=random.Random(0))
+    monkeypatch.setattr(DiceAutomation, "SELECTOR_CACHE", cache)
+    return cache
+
+
+def test_next_button_hit_recorded_only_when_clicked(cache):
+    page = FakeResultsPage([["j1", "j2"], ["j3"], ["j4"]], next_selectors=(NEXT, ARIA_NEXT))
+
+    job_ids = extract_job_ids(page, sleep_after_action=0)
+
+    assert sorted(job_ids) == ["j1", "j2", "j3", "j4"]
+    assert page.clicks == 2
+    entries = cache.entries["next_button"]
+    assert entries[NEXT]["hits"] == 2
+    # Visible but disabled on the last page: not a hit, not a timeout
+    assert entries.get(ARIA_NEXT, {}).get("hits", 0) == 0
+    assert entries.get(ARIA_NEXT, {}).get("misses", 0) == 0
+    assert cache.seconds_saved == 0
+
+
+PAGES = [["n1", "n2", "n3"], ["n4", "k1", "k2", "k3"], ["k4", "k5"], ["o1"]]
+KNOWN = ["k1", "k2", "k3", "k4", "k5"]
+
+
+def test_incremental_stops_at_previously_seen_jobs(cache):
+    page = FakeResultsPage(PAGES)
+
+    job_ids = extract_job_ids(page, sleep_after_action=0, known_ids=KNOWN)
+
+    # Newest first, known IDs dropped, pages after the frontier never requested
+    assert job_ids == ["n1", "n2", "n3", "n4"]
+    assert page.clicks == 1
+
+
+def test_incremental_stop_threshold_capped_by_history_size(cache):
+    page = FakeResultsPage(PAGES)
+
+    job_ids = extract_job_ids(page, sleep_after_action=0, known_ids=["k1"], stop_after_known=3)
+
+    assert job_ids == ["n1", "n2", "n3", "n4", "k2", "k3"]
+    assert page.clicks == 1
+
+
+def test_without_history_walks_every_page(cache):
+    page = FakeResultsPage(PAGES)
+
+    job_ids = extract_job_ids(page, sleep_after_action=0)
+
+    assert sorted(job_ids) == sorted(job_id for ids in PAGES for job_id in ids)
+    assert page.clicks == len(PAGES) - 1
@@ -0,0 +1,133 @@
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+pytest.importorskip("sentence_transformers")
+
+import DiceAutomation
+from DiceAutomation import (
+    AdaptiveConcurrency,
+    PlaywrightTimeoutError,
+    SearchHistory,
+    _sort_results_by_date,
+    apply_to_matching_jobs,
+    write_job_titles_to_file,
+)
+
+RESUME = "Jane Doe\nPython developer   with SQL"
+
+
+def test_history_keeps_newest_first_and_trims():
+    history = SearchHistory(path="", max_ids=3)
+    history.record(RESUME, "Austin, TX", ["c", "d"])
+    history.record(RESUME, "Austin, TX", ["a", "b", "c"])
+
+    assert history.known_ids(RESUME, "Austin, TX") == ["a", "b", "c"]
+    assert history.last_run(RESUME, "Austin, TX") is not None
+
+
+def test_history_key_normalises_resume_whitespace_and_location():
+    history = SearchHistory(path="", max_ids=10)
+    history.record(RESUME, "Austin, TX", ["a"])
+
+    assert history.known_ids("Jane Doe Python developer with SQL", "  austin, tx ") == ["a"]
+    assert history.known_ids(RESUME, "Denver, CO") == []
+    assert history.known_ids("Another resume", "Austin, TX") == []
+
+
+def test_history_keeps_first_seen_timestamp():
+    history = SearchHistory(path="", max_ids=10)
+    history.record(RESUME, "Remote", ["a"])
+    entry = next(iter(history.searches.values()))
+    entry["jobs"]["a"] = "2026-01-01T00:00:00+00:00"
+
+    history.record(RESUME, "Remote", ["b", "a"])
+
+    assert entry["jobs"]["a"] == "2026-01-01T00:00:00+00:00"
+    assert history.known_ids(RESUME, "Remote") == ["b", "a"]
+
+
+def test_only_decided_jobs_are_returned_for_history(monkeypatch):
+    outcomes = {"applied": True, "failed": False}
+    attempted = []
+
+    def fake_write(page, job_id, url, controller=None):
+        attempted.append(job_id)
+        return outcomes[job_id]
+
+    monkeypatch.setattr(DiceAutomation, "write_job_titles_to_file", fake_write)
+    results = [("applied", 0.9), ("failed", 0.9), ("low", 0.1), ("unscraped", 0.0)]
+    scraped_ids = {"applied", "failed", "low"}
+
+    decided = apply_to_matching_jobs(None, results, 0.8, AdaptiveConcurrency(), scraped_ids)
+
+    assert attempted == ["applied", "failed"]
+    assert decided == ["applied", "low"]
+
+
+def test_jobs_after_breaker_gives_up_are_not_decided(monkeypatch):
+    monkeypatch.setattr(DiceAutomation, "write_job_titles_to_file", lambda *args, **kwargs: True)
+    controller = AdaptiveConcurrency()
+    for _ in range(controller.breaker.max_trips):
+        controller.breaker.trip("captcha")
+
+    decided = apply_to_matching_jobs(None, [("low", 0.1), ("high", 0.9), ("later", 0.1)], 0.8, controller, {"low", "high", "later"})
+
+    assert decided == ["low"]
+
+
+class TimingOutPage:
+    def __init__(self):
+        self.context = self
+
+    def new_page(self):
+        return self
+
+    def goto(self, url):
+        raise PlaywrightTimeoutError("goto timed out")
+
+
+def test_apply_timeout_returns_false_and_feeds_breaker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    controller = AdaptiveConcurrency()
+
+    assert write_job_titles_to_file(TimingOutPage(), "job-1", "", controller) is False
+    assert controller.breaker.consecutive_failures == 1
+
+
+class FakeSortSelect:
+    def __init__(self, readback):
+        self.readback = readback
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, timeout=None):
+        pass
+
+    def select_option(self, **kwargs):
+        pass
+
+    def evaluate(self, script):
+        return self.readback
+
+
+class FakeSortPage:
+    url = "https://www.dice.com/jobs?q=python"
+
+    def __init__(self, readback):
+        self.select = FakeSortSelect(readback)
+
+    def locator(self, selector):
+        return self.select
+
+    def get_by_role(self, *args, **kwargs):
+        raise PlaywrightTimeoutError("no sort button")
+
+    def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+
+def test_sort_confirmed_only_when_read_back_as_date():
+    assert _sort_results_by_date(FakeSortPage("date Date Posted")) is True
+    assert _sort_results_by_date(FakeSortPage("relevance Relevance")) is False
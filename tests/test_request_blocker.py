@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+pytest.importorskip("sentence_transformers")
+
+from DiceAutomation import RequestBlocker, _host_matches
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, navigation=False, subframe=False):
+        self.url = url
+        self.resource_type = resource_type
+        self._navigation = navigation
+        self.frame = FakeFrame(parent_frame=FakeFrame() if subframe else None)
+
+    def is_navigation_request(self):
+        return self._navigation
+
+
+def test_host_matches_exact_host_and_subdomains_only():
+    assert _host_matches("dice.com", ["dice.com"])
+    assert _host_matches("www.dice.com", ["dice.com"])
+    assert _host_matches("static.cdn.dice.com", ["dice.com"])
+    assert not _host_matches("evil-dice.com", ["dice.com"])
+    assert not _host_matches("dice.com.evil.net", ["dice.com"])
+
+
+def test_denied_hosts_are_blocked_and_lookalikes_are_not_allowed():
+    blocker = RequestBlocker()
+    assert blocker.should_block(FakeRequest("https://stats.g.doubleclick.net/collect", "xhr"))
+    assert not blocker.should_block(FakeRequest("https://www.dice.com/api/jobs", "xhr"))
+    assert not blocker.should_block(FakeRequest("https://evil-dice.com/app.js", "script"))
+
+
+def test_allow_list_overrides_deny_list():
+    blocker = RequestBlocker(blocked_resource_types=[], blocked_hosts=["tracker.example"], allowed_hosts=["cdn.tracker.example"])
+    assert blocker.should_block(FakeRequest("https://pixel.tracker.example/p.js", "script"))
+    assert not blocker.should_block(FakeRequest("https://cdn.tracker.example/app.js", "script"))
+
+
+def test_blocked_resource_types_apply_to_allowed_hosts():
+    blocker = RequestBlocker()
+    assert blocker.should_block(FakeRequest("https://www.dice.com/logo.png", "image"))
+    assert not blocker.should_block(FakeRequest("https://www.dice.com/app.css", "stylesheet"))
+
+
+def test_only_main_frame_navigation_is_exempt():
+    blocker = RequestBlocker()
+    ad_url = "https://googleads.g.doubleclick.net/pagead/ads"
+    assert not blocker.should_block(FakeRequest(ad_url, "document", navigation=True))
+    assert blocker.should_block(FakeRequest(ad_url, "document", navigation=True, subframe=True))
+    assert not blocker.should_block(FakeRequest("https://www.dice.com/embed", "document", navigation=True, subframe=True))
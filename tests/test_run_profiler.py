@@ -0,0 +1,35 @@
+import os
+import time
+
+import pytest
+
+greenlet = pytest.importorskip("greenlet")
+
+from run_profiler import RunProfiler, WAITING_MARKER
+
+
+def test_waiting_greenlet_stack_is_attributed_to_call_site(tmp_path):
+    run_greenlet = greenlet.getcurrent()
+
+    def dispatcher():
+        # Stands in for Playwright's event-loop greenlet
+        while True:
+            time.sleep(0.02)
+            run_greenlet.switch()
+
+    dispatcher_greenlet = greenlet.greenlet(dispatcher)
+
+    def scrape_job_descriptions():
+        for _ in range(10):
+            dispatcher_greenlet.switch()
+
+    with RunProfiler(str(tmp_path)) as profiler:
+        scrape_job_descriptions()
+
+    assert os.path.exists(profiler.pstats_path)
+    with open(profiler.collapsed_path) as file:
+        stacks = file.read().splitlines()
+    waiting = [line for line in stacks if WAITING_MARKER in line]
+    assert waiting
+    assert all(line.index("scrape_job_descriptions") < line.index(WAITING_MARKER) for line in waiting)
+    assert all("dispatcher" in line.split(WAITING_MARKER, 1)[1] for line in waiting)
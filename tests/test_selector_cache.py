@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+pytest.importorskip("sentence_transformers")
+
+from DiceAutomation import SelectorCache
+
+CANDIDATES = ["a", "b", "c"]
+
+
+def make_cache(revalidate_rate=0.0, seed=0, **kwargs):
+    return SelectorCache(path="", revalidate_rate=revalidate_rate, rng=random.Random(seed), **kwargs)
+
+
+def test_order_tries_learned_winner_first():
+    cache = make_cache()
+    assert cache.order("results", CANDIDATES) == CANDIDATES
+
+    cache.record_hit("results", "c", CANDIDATES, 2, 1.5)
+
+    assert cache.order("results", CANDIDATES) == ["c", "a", "b"]
+    # Other page types are unaffected
+    assert cache.order("next_button", CANDIDATES) == CANDIDATES
+
+
+def test_revalidation_uses_default_order():
+    cache = make_cache(revalidate_rate=1.0)
+    cache.record_hit("results", "c", CANDIDATES, 2, 1.5)
+
+    assert cache.order("results", CANDIDATES) == CANDIDATES
+    assert cache.revalidations == 1
+
+
+def test_revalidation_rate_is_probabilistic():
+    cache = make_cache(revalidate_rate=0.25, seed=42)
+    cache.record_hit("results", "c", CANDIDATES, 2, 1.5)
+
+    orders = [cache.order("results", CANDIDATES) for _ in range(1000)]
+
+    assert cache.lookups == 1000
+    assert orders.count(CANDIDATES) == cache.revalidations
+    assert 180 < cache.revalidations < 320
+
+
+def test_winner_dropped_after_repeated_misses():
+    cache = make_cache(max_misses=2)
+    cache.record_hit("cookie_consent", "b", CANDIDATES, 1, 2.0)
+    cache.record_miss("cookie_consent", "b")
+    assert cache.order("cookie_consent", CANDIDATES)[0] == "b"
+
+    cache.record_miss("cookie_consent", "b")
+    assert cache.order("cookie_consent", CANDIDATES) == CANDIDATES
+
+    # A fresh hit restores it
+    cache.record_hit("cookie_consent", "b", CANDIDATES, 0, 2.0)
+    assert cache.order("cookie_consent", CANDIDATES)[0] == "b"
+
+
+def test_net_savings_arithmetic():
+    cache = make_cache()
+    # Fixed order would miss a and b before c; cached order hit c straight away
+    cache.record_hit("results", "c", CANDIDATES, 0, 1.5)
+    assert cache.seconds_saved == pytest.approx(3.0)
+    # One miss burned before c matched: saves one timeout
+    cache.record_hit("results", "c", CANDIDATES, 1, 1.5)
+    assert cache.seconds_saved == pytest.approx(4.5)
+    # Stale winner c missed before a matched: costs one timeout
+    cache.record_hit("results", "a", CANDIDATES, 1, 1.5)
+    assert cache.seconds_saved == pytest.approx(3.0)
+
+    cache.reset_stats()
+    assert cache.summary() == {"lookups": 0, "revalidations": 0, "timeout_seconds_saved": 0.0}
+    assert cache.order("results", CANDIDATES)[0] == "a"